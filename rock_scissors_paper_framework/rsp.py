@@ -45,21 +45,19 @@ Notes:
     to uppercase to match the displayed menu _options. For example: 'R', 'P', 'S'.
 """
 
-import logging
+import functools
 from dataclasses import dataclass, field
 import os
 import random
 import sys
+from collections import Counter
 from enum import auto, Enum
-from typing import Optional
-
-logging.basicConfig(level=logging.DEBUG,
-                    format='%(levelname)s - %(message)s',
-                    handlers=[logging.StreamHandler()])
+from typing import Iterable, Iterator, Optional
 
 
 DEFAULT_CHOICE_NAMES: tuple[str, ...] = ('Rock', 'Paper', 'Scissors')
 QUIT_KEY: str = 'Q'  # Reserved for quitting the program.
+CLEAR_SCREEN: str = '\033[H\033[2J'  # ANSI: cursor home, clear screen.
 
 HandNames = tuple[str, ...]
 
@@ -72,7 +70,7 @@ class HandResult(Enum):
     DRAW = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Scores:
     """Tally of score for games played."""
 
@@ -95,6 +93,8 @@ class GameOptions:
         config = GameOptions(('Rock', 'Paper', 'Scissors', 'Lizard', 'Batman'))
     """
 
+    __slots__ = ('_hand_names', '_choice_keys')
+
     def __init__(self, choice_names: HandNames) -> None:
         """Initialize game configuration object.
 
@@ -105,7 +105,40 @@ class GameOptions:
             choice_names (HandNames): A tuple of names for each Hand option.
         """
         self._hand_names: HandNames = self._validate_choices(choice_names)
-        self._choice_keys: list[str] = self._generate_choice_keys()
+        self._choice_keys: tuple[str, ...] = self._generate_choice_keys()
+
+    @classmethod
+    def get(cls, choice_names: HandNames) -> 'GameOptions':
+        """Return a shared, validated GameOptions for choice_names.
+
+        Instances are cached by their choice names, so repeated requests for
+        the same configuration skip validation and key generation.
+        The cache is keyed on the names as passed, before whitespace is
+        stripped, so ('Rock ', ...) and ('Rock', ...) give two distinct
+        instances with the same names and keys.
+
+        Args:
+            choice_names (HandNames): A tuple of names for each Hand option.
+
+        Raises:
+            TypeError: The choices are not a hashable tuple[str, ...].
+            ValueError: The choices are invalid.
+
+        Returns:
+            GameOptions: The cached game configuration.
+        """
+        if (not isinstance(choice_names, tuple)
+                or not all(isinstance(name, str) for name in choice_names)):
+            # Let validation report the problem, rather than the cache
+            # failing to hash the argument.
+            return cls(choice_names)
+        return cls._get_cached(choice_names)
+
+    @classmethod
+    @functools.cache
+    def _get_cached(cls, choice_names: HandNames) -> 'GameOptions':
+        """Return the cached GameOptions for a tuple of strings."""
+        return cls(choice_names)
 
     @property
     def names(self) -> HandNames:
@@ -122,8 +155,12 @@ class GameOptions:
 
     @property
     def choice_keys(self) -> list[str]:
-        """Return list of menu options."""
-        return self._choice_keys
+        """Return list of menu options.
+
+        A new list is returned on each access, so that callers cannot modify
+        a (possibly shared) GameOptions instance.
+        """
+        return list(self._choice_keys)
 
     @staticmethod
     def _validate_choices(choices: HandNames) -> HandNames:
@@ -158,13 +195,8 @@ class GameOptions:
         if len(choices) % 2 == 0:
             raise ValueError("Number of choices must be odd.")
 
-        # Strip leading / trailing whitespace
-        try:
-            choices = tuple(choice.strip() for choice in choices)
-        except AttributeError as exc:
-            raise TypeError(f"Invalid choice name: {exc}") from exc
-
-        # Check choice (str) items:
+        # Check choice (str) items in a single pass:
+        validated: list[str] = []
         found_choices: set[str] = set()
         found_keys: set[str] = set()
         for choice in choices:
@@ -172,6 +204,8 @@ class GameOptions:
             if not isinstance(choice, str):
                 raise TypeError("Each choice must be a string. "
                                 f"Received {type(choice)}")
+            # Strip leading / trailing whitespace
+            choice = choice.strip()
             # string not empty
             if choice == '':
                 raise ValueError("Choice name cannot be an empty string.")
@@ -181,20 +215,22 @@ class GameOptions:
             found_choices.add(choice)
             # Begins with a unique letter (case-insensitive).
             # Required as this version uses the first letter as the menu option.
-            if choice[0].upper() in found_keys:
+            first_letter = choice[0].upper()
+            if first_letter in found_keys:
                 raise ValueError("Each choice must begin with a unique letter. "
                                  f"Duplicate found: '{choice[0]}'.")
-            found_keys.add(choice[0].upper())
+            found_keys.add(first_letter)
+            validated.append(choice)
 
-        return choices
+        return tuple(validated)
 
-    def _generate_choice_keys(self) -> list[str]:
+    def _generate_choice_keys(self) -> tuple[str, ...]:
         """Generate a unique menu option for each Hand name.
 
         Currently, we use the uppercase first letter of the name, which
         must be unique.
         """
-        return [choice[0].upper() for choice in self.names]
+        return tuple(choice[0].upper() for choice in self.names)
 
 
 class UI:
@@ -203,34 +239,70 @@ class UI:
     A simple text interface in a Terminal window.
     """
 
-    def __init__(self, config: GameOptions) -> None:
+    def __init__(self, config: GameOptions,
+                 moves: Optional[Iterable[str]] = None) -> None:
         """Initialise user interface.
 
         Args:
             config (GameOptions): Contains Hand names and menu key properties.
+            moves (Iterable[str]): Optional scripted player input, consumed
+                one item per prompt instead of reading stdin. When exhausted,
+                the game quits. Default = None
         """
         self.names = config.names
+        self._moves: Optional[Iterator[str]] = (None if moves is None
+                                                else iter(moves))
         self._menu_options: list[str] = config.choice_keys
 
+        # Messages are invariant for the life of the UI, so build them once.
+        # Prompt is in the form:
+        #     '[R]ock, [P]aper, [S]cissors, or [Q] to quit: '
+        choice_parts: list[str] = []
+        key_parts: list[str] = []
+        for name, key in zip(self.names, self._menu_options):
+            choice_parts.append(f"[{key}]{name[1:]}")
+            key_parts.append(f"'{key}'")
+        self._prompt: str = (f"{', '.join(choice_parts)}, "
+                             f"or [{QUIT_KEY}] to quit: ")
+        self._invalid_msg: str = ("Invalid choice. Must be one of: "
+                                  f"{', '.join(key_parts)}.")
+
+        # Piped input is read line by line and quits cleanly at end of input.
+        self._interactive: bool = sys.stdin.isatty()
+
+        # Resolve how to clear the screen once, rather than every round.
+        self._clear_sequence: str = self._resolve_clear_sequence()
+
     def get_user_input(self) -> str:
         """Prompt user for input."""
-        prompt = (f"{self._format_choices()}, "
-                  f"or [{QUIT_KEY}] to quit: ")
-        return input(prompt).strip().upper()
-
-    def _format_choices(self) -> str:
-        """Return formatted string of choices.
-
-        Formatted string in the form:
-            '[R]ock, [S]cissors, [P]aper'
+        if self._moves is not None:
+            user_input = next(self._moves, QUIT_KEY)
+        elif self._interactive:
+            user_input = input(self._prompt)
+        else:
+            user_input = self._read_line()
+        if len(user_input) == 1:
+            # Fast path for the expected single key press.
+            # A lone whitespace character is still rejected as invalid.
+            return user_input.upper()
+        return user_input.strip().upper()
+
+    def _read_line(self) -> str:
+        """Prompt for, and return, one line of non-interactive input.
+
+        Once the input stream is exhausted, QUIT_KEY is returned so that
+        piped play ends cleanly, as with scripted moves.
         """
-        return ', '.join([f"[{name[0].upper()}]{name[1:]}"
-                          for name in self.names])
+        sys.stdout.write(self._prompt)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            return QUIT_KEY
+        return line.rstrip('\n')
 
     def invalid_choice_message(self):
         """Display invalid choice message."""
-        choice_str = ', '.join([f"'{option}'" for option in self._menu_options])
-        print(f"Invalid choice. Must be one of: {choice_str}.")
+        print(self._invalid_msg)
 
     def display_result(self, game_score: Scores,
                        player: str = '',
@@ -245,12 +317,15 @@ class UI:
             result (HandResult): The Enum value 'WIN', 'LOSE' or 'DRAW'.
                 Default = None
         """
-        self.clear_screen()
-
+        # Build the complete frame so that it is written in one call.
+        frame: list[str] = [self._clear_sequence]
         if result is not None:
-            print(f"You = {player} : "
-                  f"Computer = {robo} : YOU {result.name}")
-        print(f"Player: {game_score.player} | Computer: {game_score.robo}\n")
+            frame.append(f"You = {player} : "
+                         f"Computer = {robo} : YOU {result.name}\n")
+        frame.append(f"Player: {game_score.player} | "
+                     f"Computer: {game_score.robo}\n\n")
+        sys.stdout.write(''.join(frame))
+        sys.stdout.flush()
 
     @staticmethod
     def exit_message() -> None:
@@ -258,42 +333,66 @@ class UI:
         print("Bye")
 
     @staticmethod
-    def clear_screen() -> None:
-        """Clear the terminal screen or fallback to printing a newline."""
-        if os.name == 'nt':  # Windows
-            os.system('cls')
-        elif 'TERM' in os.environ:  # Unix-like with terminal support
-            os.system('clear')
-        else:  # Fallback
-            print('\n')
+    def _resolve_clear_sequence() -> str:
+        """Return the string that clears the screen on this output stream.
+
+        The ANSI escape sequence is used when writing to a terminal that
+        supports it. Redirected output, and Unix-like terminals with no
+        TERM or TERM=dumb, get blank lines instead of escape codes.
+        """
+        if not sys.stdout.isatty():  # Fallback
+            return '\n\n'
+        if os.name == 'nt':
+            # Enable ANSI escape sequence processing in the Windows console.
+            os.system('')
+        elif os.environ.get('TERM', 'dumb') == 'dumb':  # Fallback
+            return '\n\n'
+        return CLEAR_SCREEN
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class Hand:
     """Hand objects represent the hand gestures made by players of this game.
 
+    Hands are compared and hashed by identity, as HandManager creates exactly
+    one instance per choice.
+
     Attributes:
         name (str): Example "Rock"
         choice_key (str): Example "R"
-        beats_hands (list): A list of other Hand instances that this Hand beats.
+        index (int): Position of the Hand in the cyclic order of choices.
+            Keyword-only and required.
+        beats_hands (frozenset): The other Hand instances that this Hand beats.
     """
 
     name: str
     choice_key: str
-    beats_hands: list['Hand'] = field(default_factory=list)
+    index: int = field(kw_only=True)
+    beats_hands: frozenset['Hand'] = field(default_factory=frozenset)
 
 
 class HandManager:
     """Creates and manages Hand objects."""
 
-    def __init__(self, options: GameOptions):
-        """Initialize with game _options."""
+    def __init__(self, options: GameOptions,
+                 rng: Optional[random.Random] = None):
+        """Initialize with game _options.
+
+        Args:
+            options (GameOptions): The validated game configuration.
+            rng (random.Random): Optional random number generator, for
+                reproducible robo choices. Default = None (a new,
+                unseeded random.Random).
+        """
         self._options = options
 
         # Create list of available Hand instances.
         self._hands = self._generate_hands()
+        self._n_hands = len(self._hands)
+        self._rng_randrange = (rng or random.Random()).randrange
         self._hands_by_key = self._map_key_to_hand()
 
+        self._outcomes = self._map_outcomes()
         self._set_beats_properties()
 
     @property
@@ -317,36 +416,105 @@ class HandManager:
         """
         return self._hands_by_key[key]
 
+    def random_hand(self) -> Hand:
+        """Return a randomly selected Hand.
+
+        Used by: robo_choice().
+
+        Returns:
+            Hand: The randomly selected Hand.
+        """
+        return self._hands[self._rng_randrange(self._n_hands)]
+
+    def get_result(self, player: Hand, robo: Hand) -> HandResult:
+        """Return the result of player's Hand against robo's Hand.
+
+        Args:
+            player (Hand): The human player's Hand.
+            robo (Hand): The computer player's Hand.
+
+        Returns:
+            HandResult: The result from the human player's perspective.
+        """
+        return self._outcomes[player.index][robo.index]
+
+    def simulate(self, player_indices: Iterable[int],
+                 robo_indices: Iterable[int]) -> Scores:
+        """Return the tally for a batch of rounds, without any UI.
+
+        Intended for replaying or evaluating strategies over many rounds.
+        Rounds are paired by position; pairing stops at the shorter input.
+
+        Args:
+            player_indices (Iterable[int]): Human player's Hand index per round.
+            robo_indices (Iterable[int]): Computer's Hand index per round.
+
+        Raises:
+            ValueError: If an index is not in range(len(hands)).
+
+        Returns:
+            Scores: The wins of each player. Draws score nothing.
+        """
+        n_hands = self._n_hands
+        outcomes = self._outcomes
+        results: Counter[HandResult] = Counter()
+        for player, robo in zip(player_indices, robo_indices):
+            if not (0 <= player < n_hands and 0 <= robo < n_hands):
+                raise ValueError("Hand index out of range: "
+                                 f"player={player}, robo={robo}.")
+            results[outcomes[player][robo]] += 1
+        return Scores(player=results[HandResult.WIN],
+                      robo=results[HandResult.LOSE])
+
     def _generate_hands(self) -> list[Hand]:
         """Generate a list of Hands.
 
         One Hand for each GameOptions.name.
-        Each Hand is initialised with a name and choice-key.
+        Each Hand is initialised with a name, choice-key and index.
         """
         names = self._options.names
         keys = self._options.choice_keys
-        return [Hand(name=name, choice_key=key) for name, key in zip(names, keys)]
+        return [Hand(name=name, choice_key=key, index=idx)
+                for idx, (name, key) in enumerate(zip(names, keys))]
 
     def _map_key_to_hand(self) -> dict[str, Hand]:
         """Return dict mapping choice keys to Hands."""
         return {hand.choice_key: hand for hand in self._hands}
 
     def _set_beats_properties(self) -> None:
-        """Populate the 'beats_hands' properties of each Hand."""
-        hand_beats_map = self._map_cyclic_hierarchy()
-        for hand in self._hands:
-            hand.beats_hands = hand_beats_map[hand.name]
-
-    def _map_cyclic_hierarchy(self) -> dict[str, list[Hand]]:
-        """Return dict mapping each hand name to a list of hands that it beats."""
-        number_of_beaten = (len(self._options.names) - 1) // 2
-        hierarchy_map = {}
-        for idx, choice in enumerate(self._options.names):
-            beaten = [self._hands[idx - j - 1] for
-                      j in range(number_of_beaten)]
-            hierarchy_map[choice] = beaten
+        """Populate the 'beats_hands' properties of each Hand.
 
-        return hierarchy_map
+        Each hand beats the (n-1)//2 hands that precede it (cyclically), which
+        is a single contiguous slice of the doubled list of hands.
+        """
+        n = self._n_hands
+        number_of_beaten = (n - 1) // 2
+        doubled = self._hands + self._hands
+        for idx, hand in enumerate(self._hands):
+            hand.beats_hands = frozenset(doubled[idx + n - number_of_beaten:
+                                                 idx + n])
+
+    def _map_outcomes(self) -> list[list[HandResult]]:
+        """Return table of results, indexed by [player index][robo index].
+
+        Choices are cyclically ordered so that each Hand beats the
+        (n-1)//2 Hands that precede it. The outcome is therefore
+        determined by the distance between the two indices.
+        """
+        half = (self._n_hands - 1) // 2
+        outcomes = []
+        for player_idx in range(self._n_hands):
+            row = []
+            for robo_idx in range(self._n_hands):
+                diff = (player_idx - robo_idx) % self._n_hands
+                if diff == 0:
+                    row.append(HandResult.DRAW)
+                elif diff <= half:
+                    row.append(HandResult.WIN)
+                else:
+                    row.append(HandResult.LOSE)
+            outcomes.append(row)
+        return outcomes
 
 
 def player_choice(hm: HandManager, ui: UI) -> Hand:
@@ -380,7 +548,7 @@ def robo_choice(hm: HandManager) -> Hand:
     Returns:
         Hand: The randomly selected hand object.
     """
-    return random.choice(hm.hands)
+    return hm.random_hand()
 
 
 def quit_game(ui: UI):
@@ -389,33 +557,36 @@ def quit_game(ui: UI):
     sys.exit(0)
 
 
-def main() -> None:
-    """Game loop."""
+def main(moves: Optional[Iterable[str]] = None) -> None:
+    """Game loop.
+
+    Args:
+        moves (Iterable[str]): Optional scripted player input, such as
+            `sys.stdin.read().split()`, for unattended play. Default = None
+    """
     # Instantiate instances of Scores, GameOptions and UI.
     scores = Scores()
-    config = GameOptions(DEFAULT_CHOICE_NAMES)
-    ui = UI(config)
+    config = GameOptions.get(DEFAULT_CHOICE_NAMES)
+    ui = UI(config, moves)
 
     ui.display_result(scores)
 
     # Generate hands available in this game.
     hand_manager = HandManager(config)
 
+    # Bind methods used every round to locals, outside the game loop.
+    get_result = hand_manager.get_result
+    display_result = ui.display_result
+
     while True:
         player_hand: Hand = player_choice(hand_manager, ui)
         robo_hand: Hand = robo_choice(hand_manager)
 
-        if player_hand == robo_hand:
-            ui.display_result(scores, player_hand.name,
-                              robo_hand.name, HandResult.DRAW)
-        elif robo_hand in player_hand.beats_hands:
-            scores.player += 1
-            ui.display_result(scores, player_hand.name,
-                              robo_hand.name, HandResult.WIN)
-        else:
-            scores.robo += 1
-            ui.display_result(scores, player_hand.name,
-                              robo_hand.name, HandResult.LOSE)
+        result = get_result(player_hand, robo_hand)
+
+        scores.player += result is HandResult.WIN
+        scores.robo += result is HandResult.LOSE
+        display_result(scores, player_hand.name, robo_hand.name, result)
 
 
 if __name__ == '__main__':
@@ -13,15 +13,57 @@ def test_invalid_choices(choice_names, expected_exception):
         GameOptions(choice_names)
 
 
+@pytest.mark.parametrize('choice_names, expected_exception', invalid_data())
+def test_get_invalid_choices(choice_names, expected_exception):
+    """Check that GameOptions.get raises an error for invalid choices."""
+    with pytest.raises(expected_exception):
+        GameOptions.get(choice_names)
+
+
+@pytest.mark.parametrize('choice_names', [['Rock', 'Paper', 'Scissors'],
+                                          ('Rock', ['Paper'], 'Scissors')])
+def test_get_unhashable_choices(choice_names):
+    """GameOptions.get reports invalid unhashable input via validation."""
+    with pytest.raises(TypeError, match='Tuple required|must be a string'):
+        GameOptions.get(choice_names)
+
+
 @pytest.mark.parametrize("choice_names, expected_names", valid_data())
-def test_names(choice_names, expected_names):
+def test_get_cached(choice_names, expected_names):
+    """GameOptions.get returns one shared instance per tuple of names."""
+    config = GameOptions.get(choice_names)
+    assert config is GameOptions.get(choice_names)
+    assert config.names == expected_names['valid_HandNames']
+
+
+def test_get_choice_keys_not_shared():
+    """Mutating choice_keys cannot corrupt the cached GameOptions."""
+    config = GameOptions.get(('Rock', 'Paper', 'Scissors'))
+    config.choice_keys.append('X')
+    assert GameOptions.get(('Rock', 'Paper', 'Scissors')).choice_keys == [
+        'R', 'P', 'S']
+
+
+@pytest.fixture(scope="module", params=valid_data())
+def game_options(request):
+    """Fixture creates one GameOptions per valid case, shared by the module.
+
+    Returns:
+        tuple[GameOptions, dict]: The configuration and its expected values.
+    """
+    choice_names, expected = request.param
+    return GameOptions(choice_names), expected
+
+
+# pylint: disable=W0621
+def test_names(game_options):
     """GameOptions.choices matches initialization argument."""
-    config = GameOptions(choice_names)
+    config, expected_names = game_options
     assert config.names == expected_names['valid_HandNames']
 
 
-@pytest.mark.parametrize("choices, expected", valid_data())
-def test_choice_keys(choices, expected):
+# pylint: disable=W0621
+def test_choice_keys(game_options):
     """Each choice is beaten by half of the other choices.
 
     Where the number of choices = n, each choice beats (n - 1) / 2 choices.
@@ -29,10 +71,9 @@ def test_choice_keys(choices, expected):
     For a choice index 'i', the beaten choices are `i-1` to `i-(n-1)/2`.
 
     Args:
-        choices (HandNames): The choices used to initialse GameCofig.
-        expected (dict): Mapping of choices to the choices it beats.
+        game_options (tuple): The GameOptions and its expected values.
     """
-    config = GameOptions(choices)
+    config, expected = game_options
     assert config.choice_keys == expected['choice_keys']
 
 
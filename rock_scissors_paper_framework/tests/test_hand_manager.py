@@ -1,9 +1,10 @@
 """Unit tests for HandManager() class."""
+import random
 from typing import Any
 
 import pytest
 
-from ..rsp import GameOptions, Hand, HandManager
+from ..rsp import GameOptions, Hand, HandManager, HandResult, Scores
 from ..tests.config_data import valid_data
 
 
@@ -30,3 +31,84 @@ def test_hands(hand_manager: HandManager, expected: dict[str, Any]):
         assert isinstance(hand, Hand)
         assert hand.name == name
         assert hand.choice_key == key
+
+
+def test_get_result():
+    """HandManager().get_result follows the Rock, Paper, Scissors rules."""
+    manager = HandManager(GameOptions(('Rock', 'Paper', 'Scissors')))
+    wins = {('Rock', 'Scissors'), ('Scissors', 'Paper'), ('Paper', 'Rock')}
+    for player in manager.hands:
+        for robo in manager.hands:
+            result = manager.get_result(player, robo)
+            if player.name == robo.name:
+                assert result == HandResult.DRAW
+            elif (player.name, robo.name) in wins:
+                assert result == HandResult.WIN
+            else:
+                assert result == HandResult.LOSE
+
+
+@pytest.mark.parametrize("hand_manager, expected", valid_data(),
+                         indirect=['hand_manager'])
+# pylint: disable=W0621
+def test_random_hand(hand_manager: HandManager, expected: dict[str, Any]):
+    """HandManager().random_hand returns one of the configured Hands."""
+    assert len(hand_manager.hands) == len(expected['valid_HandNames'])
+    for _ in range(20):
+        assert hand_manager.random_hand() in hand_manager.hands
+
+
+def test_random_hand_seeded():
+    """HandManager().random_hand is reproducible with a seeded rng."""
+    options = GameOptions(('Rock', 'Paper', 'Scissors', 'Lizard', 'Batman'))
+    first = HandManager(options, rng=random.Random(42))
+    second = HandManager(options, rng=random.Random(42))
+    assert ([first.random_hand().name for _ in range(20)] ==
+            [second.random_hand().name for _ in range(20)])
+
+
+@pytest.mark.parametrize("hand_manager, expected", valid_data(),
+                         indirect=['hand_manager'])
+# pylint: disable=W0621
+def test_simulate(hand_manager: HandManager, expected: dict[str, Any]):
+    """HandManager().simulate tallies every pairing of Hands fairly.
+
+    Over all n * n pairings, each player wins n * (n - 1) / 2 rounds.
+    """
+    n = len(expected['valid_HandNames'])
+    player_indices = [p for p in range(n) for _ in range(n)]
+    robo_indices = [r for _ in range(n) for r in range(n)]
+    scores = hand_manager.simulate(player_indices, robo_indices)
+    assert scores == Scores(player=n * (n - 1) // 2, robo=n * (n - 1) // 2)
+
+
+def test_simulate_rounds():
+    """HandManager().simulate scores each round and stops at the shorter input.
+
+    Rock beats Scissors, Rock loses to Paper, Paper draws with Paper, and the
+    unpaired fourth player index is ignored.
+    """
+    manager = HandManager(GameOptions(('Rock', 'Paper', 'Scissors')))
+    scores = manager.simulate([0, 0, 1, 2], [2, 1, 1])
+    assert scores == Scores(player=1, robo=1)
+
+
+@pytest.mark.parametrize("player_indices, robo_indices",
+                         [([-1], [0]), ([0], [-1]), ([3], [0]), ([0], [3])])
+def test_simulate_invalid_index(player_indices, robo_indices):
+    """HandManager().simulate rejects indices outside range(len(hands))."""
+    manager = HandManager(GameOptions(('Rock', 'Paper', 'Scissors')))
+    with pytest.raises(ValueError):
+        manager.simulate(player_indices, robo_indices)
+
+
+def test_beats_hands():
+    """Each Hand beats the (n-1)//2 Hands that precede it, cyclically."""
+    options = GameOptions(('Rock', 'Batman', 'Paper', 'Lizard', 'Scissors'))
+    expected = {'Rock': {'Scissors', 'Lizard'},
+                'Batman': {'Rock', 'Scissors'},
+                'Paper': {'Batman', 'Rock'},
+                'Lizard': {'Paper', 'Batman'},
+                'Scissors': {'Lizard', 'Paper'}}
+    for hand in HandManager(options).hands:
+        assert {beaten.name for beaten in hand.beats_hands} == expected[hand.name]
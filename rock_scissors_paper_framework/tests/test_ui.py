@@ -7,20 +7,23 @@ Implementation specific strings are not unit tested.
 """
 
 
+import io
 from unittest.mock import patch
 
 import pytest
 
-from ..rsp import GameOptions, UI
+from ..rsp import GameOptions, QUIT_KEY, UI
 from ..tests.config_data import valid_data
 
 
 @pytest.fixture
 def display_manager():
     """Fixture to create a UI instance."""
-    def _create_display_manager(choice_names=('Rock', 'Paper', 'Scissors')):
+    def _create_display_manager(choice_names=('Rock', 'Paper', 'Scissors'),
+                                interactive=True, moves=None):
         config = GameOptions(choice_names)
-        return UI(config)
+        with patch('sys.stdin.isatty', return_value=interactive):
+            return UI(config, moves)
     return _create_display_manager
 
 
@@ -40,3 +43,51 @@ def test_get_user_input(display_manager):  # pylint: disable=W0621
         dm = display_manager()
         result = dm.get_user_input()
         assert result == expected, f"Expected {expected}, but got {result}"
+
+
+@pytest.mark.parametrize("user_input, expected", [('r', 'R'), ('P', 'P'),
+                                                  ('q', 'Q')])
+# pylint: disable=W0621
+def test_get_user_input_key(user_input, expected, display_manager):
+    """Single key presses are converted to uppercase."""
+    with patch('builtins.input', return_value=user_input):
+        dm = display_manager()
+        assert dm.get_user_input() == expected
+
+
+@pytest.mark.parametrize("user_input", [' ', '\t'])
+# pylint: disable=W0621
+def test_get_user_input_whitespace_key(user_input, display_manager):
+    """A lone whitespace character is not a valid choice or QUIT_KEY."""
+    with patch('builtins.input', return_value=user_input):
+        dm = display_manager()
+        result = dm.get_user_input()
+    assert result not in GameOptions(('Rock', 'Paper', 'Scissors')).choice_keys
+    assert result != QUIT_KEY
+
+
+@pytest.mark.parametrize("user_input, expected", [(' s ', 'S'), ('q\n', 'Q')])
+# pylint: disable=W0621
+def test_get_user_input_padded_key(user_input, expected, display_manager):
+    """Keys padded with whitespace are stripped and converted to uppercase."""
+    with patch('builtins.input', return_value=user_input):
+        dm = display_manager()
+        assert dm.get_user_input() == expected
+
+
+# pylint: disable=W0621
+def test_get_user_input_piped(display_manager):
+    """Piped input is read line by line, then QUIT_KEY once exhausted."""
+    with patch('sys.stdin', io.StringIO('  r  \np\n')):
+        dm = display_manager(interactive=False)
+        assert dm.get_user_input() == 'R'
+        assert dm.get_user_input() == 'P'
+        assert dm.get_user_input() == QUIT_KEY
+
+
+# pylint: disable=W0621
+def test_get_user_input_moves(display_manager):
+    """Scripted moves are normalized, then QUIT_KEY once exhausted."""
+    dm = display_manager(moves=[' r', 'p', 'Scissors'])
+    assert [dm.get_user_input() for _ in range(4)] == ['R', 'P', 'SCISSORS',
+                                                       QUIT_KEY]